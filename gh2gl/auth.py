@@ -1,17 +1,22 @@
 # gh2gl/auth.py
+import functools
 from typing import Optional, Tuple
 
 import keyring
-import requests
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 
-# Create Rich console
+# Rich console shared by every gh2gl command
 console = Console()
 
 
+@functools.lru_cache(maxsize=None)
+def _kr(service: str, key: str) -> Optional[str]:
+    """Get a keyring secret, cached for the rest of the process."""
+    return keyring.get_password(service, key)
+
+
 def login_github():
     console.print(
         Panel.fit(
@@ -24,6 +29,8 @@ def login_github():
 
     keyring.set_password("gh2gl", "github_username", username)
     keyring.set_password("gh2gl", "github_token", token)
+    _kr.cache_clear()
+    check_credentials_status.cache_clear()
 
     console.print(
         Panel(
@@ -34,6 +41,14 @@ def login_github():
     )
 
 
+def normalize_gitlab_url(url: str) -> str:
+    """Give a GitLab instance URL a scheme and drop surrounding whitespace and slashes."""
+    url = url.strip().rstrip("/")
+    if "://" not in url:
+        url = f"https://{url}"
+    return url
+
+
 def login_gitlab():
     console.print(
         Panel.fit(
@@ -46,9 +61,11 @@ def login_gitlab():
     username = typer.prompt("GitLab username")
     token = typer.prompt("GitLab personal access token", hide_input=True)
 
-    keyring.set_password("gh2gl", "gitlab_url", server_url)
+    keyring.set_password("gh2gl", "gitlab_url", normalize_gitlab_url(server_url))
     keyring.set_password("gh2gl", "gitlab_username", username)
     keyring.set_password("gh2gl", "gitlab_token", token)
+    _kr.cache_clear()
+    check_credentials_status.cache_clear()
 
     console.print(
         Panel(
@@ -61,19 +78,23 @@ def login_gitlab():
 
 def get_github_credentials() -> Tuple[Optional[str], Optional[str]]:
     """Get GitHub credentials from keyring."""
-    username = keyring.get_password("gh2gl", "github_username")
-    token = keyring.get_password("gh2gl", "github_token")
+    username = _kr("gh2gl", "github_username")
+    token = _kr("gh2gl", "github_token")
     return username, token
 
 
 def get_gitlab_credentials() -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Get GitLab credentials from keyring."""
-    url = keyring.get_password("gh2gl", "gitlab_url")
-    username = keyring.get_password("gh2gl", "gitlab_username")
-    token = keyring.get_password("gh2gl", "gitlab_token")
+    url = _kr("gh2gl", "gitlab_url")
+    if url:
+        # Values saved by older versions may lack a scheme
+        url = normalize_gitlab_url(url)
+    username = _kr("gh2gl", "gitlab_username")
+    token = _kr("gh2gl", "gitlab_token")
     return url, username, token
 
 
+@functools.lru_cache(maxsize=1)
 def check_credentials_status() -> dict:
     """Check if credentials are configured."""
     github_username, github_token = get_github_credentials()
@@ -102,20 +123,25 @@ def test_github_connection() -> Tuple[bool, str]:
     if not username or not token:
         return False, "GitHub credentials not configured"
 
+    import orjson
+    import requests
+
+    from gh2gl.session import SESSION
+
     try:
         headers = {"Authorization": f"token {token}"}
-        response = requests.get(
+        response = SESSION.get(
             "https://api.github.com/user", headers=headers, timeout=10
         )
 
         if response.status_code == 200:
-            user_data = response.json()
+            user_data = orjson.loads(response.content)
             return True, f"Connected as {user_data.get('login', username)}"
         elif response.status_code == 401:
             return False, "Invalid GitHub token"
         else:
             return False, f"GitHub API error: {response.status_code}"
-    except requests.RequestException as e:
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         return False, f"Connection error: {str(e)}"
 
 
@@ -126,18 +152,23 @@ def test_gitlab_connection() -> Tuple[bool, str]:
     if not url or not username or not token:
         return False, "GitLab credentials not configured"
 
+    import orjson
+    import requests
+
+    from gh2gl.session import SESSION
+
     try:
         # Remove trailing slash if present
         base_url = url.rstrip("/")
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(f"{base_url}/api/v4/user", headers=headers, timeout=10)
+        response = SESSION.get(f"{base_url}/api/v4/user", headers=headers, timeout=10)
 
         if response.status_code == 200:
-            user_data = response.json()
+            user_data = orjson.loads(response.content)
             return True, f"Connected as {user_data.get('username', username)}"
         elif response.status_code == 401:
             return False, "Invalid GitLab token"
         else:
             return False, f"GitLab API error: {response.status_code}"
-    except requests.RequestException as e:
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         return False, f"Connection error: {str(e)}"
@@ -1,20 +1,8 @@
 # gh2gl/cli.py
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-from gh2gl.auth import (
-    check_credentials_status,
-    login_github,
-    login_gitlab,
-    test_github_connection,
-    test_gitlab_connection,
-)
-from gh2gl.mirror import mirror_repos
-
-# Create Rich console
-console = Console()
+
+# Rich, keyring, requests and the gh2gl modules are imported inside the
+# commands that need them, keeping `gh2gl --help` and startup fast.
 
 app = typer.Typer()
 
@@ -24,11 +12,15 @@ app.add_typer(login_app, name="login", help="Login to services")
 
 @login_app.command("github")
 def login_github_cmd():
+    from gh2gl.auth import login_github
+
     login_github()
 
 
 @login_app.command("gitlab")
 def login_gitlab_cmd():
+    from gh2gl.auth import login_gitlab
+
     login_gitlab()
 
 
@@ -45,6 +37,24 @@ def mirror(
         "--force",
         help="Force sync existing GitLab repositories with GitHub (overwrite GitLab content)",
     ),
+    jobs: int = typer.Option(
+        8, "--jobs", "-j", "--concurrency", min=1, help="Number of repositories to mirror in parallel"
+    ),
+    partial_clone: bool = typer.Option(
+        False,
+        "--partial",
+        help="Clone without file contents and fetch only the blobs GitLab is missing while pushing",
+    ),
+    server_import: bool = typer.Option(
+        False,
+        "--server-import",
+        help="Let GitLab import new repositories directly from GitHub instead of cloning locally",
+    ),
+    keep_clones: bool = typer.Option(
+        False,
+        "--keep-clones",
+        help="Keep local bare mirrors between runs and only fetch new objects from GitHub",
+    ),
 ):
     """
     Mirror all GitHub repositories to GitLab.
@@ -57,10 +67,25 @@ def mirror(
     --dry-run: Preview what would be done without making changes
     --skip-existing: Skip repositories that already exist on GitLab
     --force: Force overwrite existing GitLab repositories with GitHub content
+    --jobs/--concurrency: Number of repositories to mirror in parallel (default: 8)
+    --partial: Use a blob-less partial clone (best for syncing existing projects)
+    --server-import: Let GitLab import new repositories straight from GitHub
+    --keep-clones: Keep local mirrors between runs and fetch incrementally
 
-    Note: --skip-existing and --force cannot be used together.
+    Note: --skip-existing and --force cannot be used together, nor can
+    --keep-clones and --partial.
     """
-    mirror_repos(dry_run=dry_run, skip_existing=skip_existing, force=force)
+    from gh2gl.mirror import mirror_repos
+
+    mirror_repos(
+        dry_run=dry_run,
+        skip_existing=skip_existing,
+        force=force,
+        jobs=jobs,
+        partial_clone=partial_clone,
+        server_import=server_import,
+        keep_clones=keep_clones,
+    )
 
 
 @app.command()
@@ -68,6 +93,11 @@ def status():
     """
     Show the status of configured credentials.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from gh2gl.auth import check_credentials_status, console
+
     console.print(
         Panel.fit("[bold cyan]🔍 Credentials Status[/bold cyan]", border_style="cyan")
     )
@@ -164,7 +194,10 @@ def test():
     """
     Test connectivity to GitHub and GitLab APIs.
     """
-    console = Console()
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from gh2gl.auth import console, test_github_connection, test_gitlab_connection
 
     console.print(
         Panel(
@@ -0,0 +1,53 @@
+# gh2gl/session.py
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "gh2gl"
+# (connect, read) seconds, applied when a call does not pass its own timeout
+DEFAULT_TIMEOUT = (10, 60)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that gives every request a timeout unless one is passed."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+def create_session() -> requests.Session:
+    """
+    Create a requests session with connection pooling and automatic retries.
+
+    Keeping connections alive avoids a TCP/TLS handshake per API call, and the
+    retry policy transparently recovers from transient server errors, rate
+    limiting (honouring Retry-After) and dropped connections. A default
+    timeout keeps a stalled connection from holding a worker forever.
+    """
+    session = requests.Session()
+
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Hand the final response back to the caller instead of raising
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers.update(
+        {
+            "User-Agent": USER_AGENT,
+            # GitHub's preferred media type, with plain JSON for GitLab
+            "Accept": "application/vnd.github+json, application/json",
+        }
+    )
+    return session
+
+
+# Shared session used for every GitHub and GitLab API call
+SESSION = create_session()